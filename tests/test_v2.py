@@ -387,6 +387,50 @@ async def test_resize(store: Store):
     assert await store.get_async("resize/1.1") is None
 
 
+@pytest.mark.asyncio
+async def test_write_trailing_chunk_region(store: Store):
+    data = np.arange(0, 12 * 12, dtype="uint16").reshape((12, 12))
+
+    a = await ArrayV2.create_async(
+        store / "write_trailing_chunk_region",
+        shape=data.shape,
+        chunks=(8, 8),
+        dtype=data.dtype,
+        fill_value=1,
+    )
+    await a.async_[:, :].set(data)
+
+    # overwriting exactly the valid region of a trailing chunk skips the
+    # read-modify-write cycle; no stale data may survive
+    expected = data.copy()
+    expected[8:12, 8:12] = data[8:12, 8:12] + 100
+    await a.async_[8:12, 8:12].set(expected[8:12, 8:12])
+    assert np.array_equal(await a.async_[:, :].get(), expected)
+
+    # a narrower write into a trailing chunk must preserve the prior data
+    expected[9:11, 9:11] = 0
+    await a.async_[9:11, 9:11].set(expected[9:11, 9:11])
+    assert np.array_equal(await a.async_[:, :].get(), expected)
+
+
+@pytest.mark.asyncio
+async def test_scalar_write(store: Store):
+    a = await ArrayV2.create_async(
+        store / "scalar_write",
+        shape=(16, 16),
+        chunks=(8, 8),
+        dtype="uint16",
+        fill_value=1,
+    )
+    await a.async_[:, :].set(3)
+    assert np.all(await a.async_[:, :].get() == 3)
+
+    # broadcasting the fill value deletes the chunks again
+    await a.async_[:, :].set(1)
+    assert np.all(await a.async_[:, :].get() == 1)
+    assert await store.get_async("scalar_write/0.0") is None
+
+
 def test_update_attributes_array(store: Store):
     data = np.zeros((16, 18), dtype="uint16")
 
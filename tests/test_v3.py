@@ -447,6 +447,90 @@ def test_write_partial_sharded_chunks(store: Store):
     assert np.array_equal(a[0:16, 0:16], data)
 
 
+def test_sharding_partial_read_ranges(store: Store):
+    data = np.arange(0, 32 * 32, dtype="uint16").reshape((32, 32))
+
+    a = Array.create(
+        store / "sharding_partial_read_ranges",
+        shape=data.shape,
+        chunk_shape=(32, 32),
+        dtype=data.dtype,
+        fill_value=0,
+        codecs=[codecs.sharding_codec(chunk_shape=(4, 4))],
+    )
+    a[:, :] = data
+
+    # single inner chunk
+    assert np.array_equal(a[4:8, 8:12], data[4:8, 8:12])
+    # inner chunks that are adjacent in the shard
+    assert np.array_equal(a[0:8, 0:8], data[0:8, 0:8])
+    # inner chunks from scattered, non-adjacent shard offsets
+    assert np.array_equal(a[2:30, 5:7], data[2:30, 5:7])
+    assert np.array_equal(a[3:29, 3:29], data[3:29, 3:29])
+
+
+def test_sharding_partial_read_missing_chunks(store: Store):
+    data = np.arange(0, 4 * 4, dtype="uint16").reshape((4, 4))
+
+    a = Array.create(
+        store / "sharding_partial_read_missing_chunks",
+        shape=(32, 32),
+        chunk_shape=(32, 32),
+        dtype=data.dtype,
+        fill_value=1,
+        codecs=[codecs.sharding_codec(chunk_shape=(4, 4))],
+    )
+    a[4:8, 4:8] = data
+
+    # empty inner chunks within the requested range read as fill_value
+    expected = np.ones((12, 12), dtype="uint16")
+    expected[4:8, 4:8] = data
+    assert np.array_equal(a[0:12, 0:12], expected)
+
+
+def test_write_trailing_chunk_region(store: Store):
+    data = np.arange(0, 12 * 12, dtype="uint16").reshape((12, 12))
+
+    a = Array.create(
+        store / "write_trailing_chunk_region",
+        shape=data.shape,
+        chunk_shape=(8, 8),
+        dtype=data.dtype,
+        fill_value=1,
+    )
+    a[:, :] = data
+
+    # overwriting exactly the valid region of a trailing chunk skips the
+    # read-modify-write cycle; no stale data may survive
+    expected = data.copy()
+    expected[8:12, 8:12] = data[8:12, 8:12] + 100
+    a[8:12, 8:12] = expected[8:12, 8:12]
+    assert np.array_equal(a[:, :], expected)
+
+    # a narrower write into a trailing chunk must preserve the prior data
+    expected[9:11, 9:11] = 0
+    a[9:11, 9:11] = expected[9:11, 9:11]
+    assert np.array_equal(a[:, :], expected)
+
+
+@pytest.mark.asyncio
+async def test_scalar_write(store: Store):
+    a = await Array.create_async(
+        store / "scalar_write",
+        shape=(16, 16),
+        chunk_shape=(8, 8),
+        dtype="uint16",
+        fill_value=1,
+    )
+    await a.async_[:, :].set(3)
+    assert np.all(await a.async_[:, :].get() == 3)
+
+    # broadcasting the fill value deletes the chunks again
+    await a.async_[:, :].set(1)
+    assert np.all(await a.async_[:, :].get() == 1)
+    assert await store.get_async("scalar_write/c/0/0") is None
+
+
 @pytest.mark.asyncio
 async def test_delete_empty_chunks(store: Store):
     data = np.ones((16, 16))
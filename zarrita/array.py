@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Iterable, Literal, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
 import numpy as np
-from attr import evolve, frozen
+from attr import evolve, field, frozen
 
 from zarrita.array_v2 import ArrayV2
 from zarrita.codecs import CodecMetadata, CodecPipeline, bytes_codec
@@ -13,9 +13,15 @@ from zarrita.common import (
     ChunkCoords,
     Selection,
     SliceSelection,
+    all_equal,
     concurrent_map,
 )
-from zarrita.indexing import BasicIndexer, all_chunk_coords, is_total_slice
+from zarrita.indexing import (
+    BasicIndexer,
+    all_chunk_coords,
+    is_total_slice,
+    valid_chunk_shape,
+)
 from zarrita.metadata import (
     ArrayMetadata,
     DataType,
@@ -32,6 +38,9 @@ from zarrita.sharding import ShardingCodec
 from zarrita.store import StoreLike, StorePath, make_store_path
 from zarrita.sync import sync
 
+# number of chunk-sized scratch buffers an array keeps around for reuse
+_CHUNK_BUFFER_POOL_SIZE = 8
+
 
 @frozen
 class _AsyncArrayProxy:
@@ -49,22 +58,19 @@ class _AsyncArraySelectionProxy:
     async def get(self) -> np.ndarray:
         return await self.array._get_async(self.selection)
 
-    async def set(self, value: np.ndarray):
+    async def set(self, value: Union[np.ndarray, int, float, bool]):
         return await self.array._set_async(self.selection, value)
 
 
-def _json_convert(o):
-    if isinstance(o, DataType):
-        return o.name
-    raise TypeError
-
-
 @frozen
 class Array:
     metadata: ArrayMetadata
     store_path: StorePath
     runtime_configuration: RuntimeConfiguration
     codec_pipeline: CodecPipeline
+    _chunk_buffer_pool: List[np.ndarray] = field(
+        init=False, factory=list, eq=False, repr=False
+    )
 
     @classmethod
     async def create_async(
@@ -293,10 +299,17 @@ class Array:
         )
 
         # reading chunks and decoding them
+        encode_chunk_key = self.metadata.chunk_key_encoding.encode_chunk_key
         await concurrent_map(
             [
-                (chunk_coords, chunk_selection, out_selection, out)
-                for chunk_coords, chunk_selection, out_selection in indexer
+                (
+                    self.store_path / encode_chunk_key(chunk_coords),
+                    chunk_selection,
+                    out_selection,
+                    is_total,
+                    out,
+                )
+                for chunk_coords, chunk_selection, out_selection, is_total in indexer
             ],
             self._read_chunk,
             self.runtime_configuration.concurrency,
@@ -309,21 +322,15 @@ class Array:
 
     async def _read_chunk(
         self,
-        chunk_coords: ChunkCoords,
+        store_path: StorePath,
         chunk_selection: SliceSelection,
         out_selection: SliceSelection,
+        is_total: bool,
         out: np.ndarray,
     ):
-        chunk_key_encoding = self.metadata.chunk_key_encoding
-        chunk_key = chunk_key_encoding.encode_chunk_key(chunk_coords)
-        store_path = self.store_path / chunk_key
-
-        if len(self.codec_pipeline.codecs) == 1 and isinstance(
-            self.codec_pipeline.codecs[0], ShardingCodec
-        ):
-            chunk_array = await self.codec_pipeline.codecs[0].decode_partial(
-                store_path, chunk_selection
-            )
+        codecs = self.codec_pipeline.codecs
+        if len(codecs) == 1 and isinstance(codecs[0], ShardingCodec):
+            chunk_array = await codecs[0].decode_partial(store_path, chunk_selection)
             if chunk_array is not None:
                 out[out_selection] = chunk_array
             else:
@@ -332,15 +339,37 @@ class Array:
             chunk_bytes = await store_path.get_async()
             if chunk_bytes is not None:
                 chunk_array = await self.codec_pipeline.decode(chunk_bytes)
-                tmp = chunk_array[chunk_selection]
-                out[out_selection] = tmp
+                if is_total:
+                    # the selection spans the whole chunk, no need to slice
+                    out[out_selection] = chunk_array
+                else:
+                    out[out_selection] = chunk_array[chunk_selection]
             else:
                 out[out_selection] = self.metadata.fill_value
 
-    def __setitem__(self, selection: Selection, value: np.ndarray) -> None:
+    def _acquire_chunk_buffer(self) -> np.ndarray:
+        # chunk-sized scratch buffers are reused across chunks to avoid
+        # allocator churn; all tasks run on one event loop thread, so
+        # plain list operations are sufficient
+        if self._chunk_buffer_pool:
+            return self._chunk_buffer_pool.pop()
+        return np.empty(
+            self.metadata.chunk_grid.configuration.chunk_shape,
+            dtype=self.metadata.dtype,
+        )
+
+    def _release_chunk_buffer(self, chunk_array: np.ndarray) -> None:
+        if len(self._chunk_buffer_pool) < _CHUNK_BUFFER_POOL_SIZE:
+            self._chunk_buffer_pool.append(chunk_array)
+
+    def __setitem__(
+        self, selection: Selection, value: Union[np.ndarray, int, float, bool]
+    ) -> None:
         sync(self._set_async(selection, value), self.runtime_configuration.asyncio_loop)
 
-    async def _set_async(self, selection: Selection, value: np.ndarray) -> None:
+    async def _set_async(
+        self, selection: Selection, value: Union[np.ndarray, int, float, bool]
+    ) -> None:
         chunk_shape = self.metadata.chunk_grid.configuration.chunk_shape
         indexer = BasicIndexer(
             selection,
@@ -355,23 +384,59 @@ class Array:
             # setting a scalar value
             pass
         else:
-            if not hasattr(value, "shape"):
+            if not isinstance(value, np.ndarray):
                 value = np.asarray(value, self.metadata.dtype)
             assert value.shape == sel_shape
             if value.dtype.name != self.metadata.dtype.name:
                 value = value.astype(self.metadata.dtype, order="A")
 
+        encode_chunk_key = self.metadata.chunk_key_encoding.encode_chunk_key
+        chunk_projections = list(indexer)
+
+        if np.isscalar(value):
+            # when broadcasting a scalar, every full chunk holds the same
+            # data: encode it once and reuse the bytes for all of them
+            total_projections = [p for p in chunk_projections if p.is_total]
+            chunk_projections = [p for p in chunk_projections if not p.is_total]
+
+            if total_projections:
+                if value == self.metadata.fill_value:
+                    # chunks that only contain fill_value will be removed
+                    scalar_chunk_bytes = None
+                else:
+                    chunk_array = self._acquire_chunk_buffer()
+                    chunk_array.fill(value)
+                    scalar_chunk_bytes = await self.codec_pipeline.encode(chunk_array)
+                    self._release_chunk_buffer(chunk_array)
+
+                async def _write_scalar_chunk(store_path: StorePath) -> None:
+                    if scalar_chunk_bytes is None:
+                        await store_path.delete_async()
+                    else:
+                        await store_path.set_async(scalar_chunk_bytes)
+
+                await concurrent_map(
+                    [
+                        (self.store_path / encode_chunk_key(p.chunk_coords),)
+                        for p in total_projections
+                    ],
+                    _write_scalar_chunk,
+                    self.runtime_configuration.concurrency,
+                )
+
         # merging with existing data and encoding chunks
         await concurrent_map(
             [
                 (
                     value,
                     chunk_shape,
-                    chunk_coords,
-                    chunk_selection,
-                    out_selection,
+                    p.chunk_coords,
+                    p.chunk_selection,
+                    p.out_selection,
+                    p.is_total,
+                    self.store_path / encode_chunk_key(p.chunk_coords),
                 )
-                for chunk_coords, chunk_selection, out_selection in indexer
+                for p in chunk_projections
             ],
             self._write_chunk,
             self.runtime_configuration.concurrency,
@@ -384,22 +449,19 @@ class Array:
         chunk_coords: ChunkCoords,
         chunk_selection: SliceSelection,
         out_selection: SliceSelection,
+        is_total: bool,
+        store_path: StorePath,
     ):
-        chunk_key_encoding = self.metadata.chunk_key_encoding
-        chunk_key = chunk_key_encoding.encode_chunk_key(chunk_coords)
-        store_path = self.store_path / chunk_key
-
-        if is_total_slice(chunk_selection, chunk_shape):
+        if is_total:
             # write entire chunks
             if np.isscalar(value):
-                chunk_array = np.empty(
-                    chunk_shape,
-                    dtype=self.metadata.dtype,
-                )
+                chunk_array = self._acquire_chunk_buffer()
                 chunk_array.fill(value)
+                await self._write_chunk_to_store(store_path, chunk_array)
+                self._release_chunk_buffer(chunk_array)
             else:
                 chunk_array = value[out_selection]
-            await self._write_chunk_to_store(store_path, chunk_array)
+                await self._write_chunk_to_store(store_path, chunk_array)
 
         elif len(self.codec_pipeline.codecs) == 1 and isinstance(
             self.codec_pipeline.codecs[0], ShardingCodec
@@ -413,28 +475,39 @@ class Array:
             )
         else:
             # writing partial chunks
-            # read chunk first
-            chunk_bytes = await store_path.get_async()
+            if is_total_slice(
+                chunk_selection,
+                valid_chunk_shape(chunk_coords, chunk_shape, self.metadata.shape),
+            ):
+                # the selection covers the entire valid region of a trailing
+                # chunk; existing data would be overwritten completely, so
+                # there is no need to read the chunk first
+                chunk_bytes = None
+            else:
+                # read chunk first
+                chunk_bytes = await store_path.get_async()
 
             # merge new value
+            pooled_buffer = chunk_bytes is None
             if chunk_bytes is None:
-                chunk_array = np.empty(
-                    chunk_shape,
-                    dtype=self.metadata.dtype,
-                )
+                chunk_array = self._acquire_chunk_buffer()
                 chunk_array.fill(self.metadata.fill_value)
             else:
-                chunk_array = (
-                    await self.codec_pipeline.decode(chunk_bytes)
-                ).copy()  # make a writable copy
+                chunk_array = await self.codec_pipeline.decode(chunk_bytes)
+                if not chunk_array.flags.writeable:
+                    # decoding may return a read-only view over the
+                    # fetched bytes
+                    chunk_array = chunk_array.copy()
             chunk_array[chunk_selection] = value[out_selection]
 
             await self._write_chunk_to_store(store_path, chunk_array)
+            if pooled_buffer:
+                self._release_chunk_buffer(chunk_array)
 
     async def _write_chunk_to_store(
         self, store_path: StorePath, chunk_array: np.ndarray
     ):
-        if np.all(chunk_array == self.metadata.fill_value):
+        if all_equal(chunk_array, self.metadata.fill_value):
             # chunks that only contain fill_value will be removed
             await store_path.delete_async()
         else:
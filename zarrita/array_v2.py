@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 
 import numcodecs
 import numpy as np
-from attr import evolve, frozen
+from attr import evolve, field, frozen
 from numcodecs.compat import ensure_bytes, ensure_ndarray
 
 from zarrita.common import (
@@ -16,10 +16,16 @@ from zarrita.common import (
     ChunkCoords,
     Selection,
     SliceSelection,
+    all_equal,
     concurrent_map,
     to_thread,
 )
-from zarrita.indexing import BasicIndexer, all_chunk_coords, is_total_slice
+from zarrita.indexing import (
+    BasicIndexer,
+    all_chunk_coords,
+    is_total_slice,
+    valid_chunk_shape,
+)
 from zarrita.metadata import ArrayV2Metadata, RuntimeConfiguration
 from zarrita.store import StoreLike, StorePath, make_store_path
 from zarrita.sync import sync
@@ -27,6 +33,9 @@ from zarrita.sync import sync
 if TYPE_CHECKING:
     from zarrita.array import Array
 
+# number of chunk-sized scratch buffers an array keeps around for reuse
+_CHUNK_BUFFER_POOL_SIZE = 8
+
 
 @frozen
 class _AsyncArrayProxy:
@@ -44,7 +53,7 @@ class _AsyncArraySelectionProxy:
     async def get(self) -> np.ndarray:
         return await self.array.get_async(self.selection)
 
-    async def set(self, value: np.ndarray):
+    async def set(self, value: Union[np.ndarray, int, float, bool]):
         return await self.array.set_async(self.selection, value)
 
 
@@ -54,6 +63,9 @@ class ArrayV2:
     attributes: Optional[Dict[str, Any]]
     store_path: StorePath
     runtime_configuration: RuntimeConfiguration
+    _chunk_buffer_pool: List[np.ndarray] = field(
+        init=False, factory=list, eq=False, repr=False
+    )
 
     @classmethod
     async def create_async(
@@ -61,7 +73,7 @@ class ArrayV2:
         store: StoreLike,
         *,
         shape: ChunkCoords,
-        dtype: np.dtype,
+        dtype: Union[str, np.dtype],
         chunks: ChunkCoords,
         dimension_separator: Literal[".", "/"] = ".",
         fill_value: Optional[Union[None, int, float]] = None,
@@ -105,7 +117,7 @@ class ArrayV2:
         store: StoreLike,
         *,
         shape: ChunkCoords,
-        dtype: np.dtype,
+        dtype: Union[str, np.dtype],
         chunks: ChunkCoords,
         dimension_separator: Literal[".", "/"] = ".",
         fill_value: Optional[Union[None, int, float]] = None,
@@ -232,12 +244,20 @@ class ArrayV2:
         )
 
         # reading chunks and decoding them
+        encode_chunk_key = self._encode_chunk_key
         await concurrent_map(
             [
-                (chunk_coords, chunk_selection, out_selection, out)
-                for chunk_coords, chunk_selection, out_selection in indexer
+                (
+                    self.store_path / encode_chunk_key(chunk_coords),
+                    chunk_selection,
+                    out_selection,
+                    is_total,
+                    out,
+                )
+                for chunk_coords, chunk_selection, out_selection, is_total in indexer
             ],
             self._read_chunk,
+            self.runtime_configuration.concurrency,
         )
 
         if out.shape:
@@ -247,17 +267,19 @@ class ArrayV2:
 
     async def _read_chunk(
         self,
-        chunk_coords: ChunkCoords,
+        store_path: StorePath,
         chunk_selection: SliceSelection,
         out_selection: SliceSelection,
+        is_total: bool,
         out: np.ndarray,
     ):
-        store_path = self.store_path / self._encode_chunk_key(chunk_coords)
-
         chunk_array = await self._decode_chunk(await store_path.get_async())
         if chunk_array is not None:
-            tmp = chunk_array[chunk_selection]
-            out[out_selection] = tmp
+            if is_total:
+                # the selection spans the whole chunk, no need to slice
+                out[out_selection] = chunk_array
+            else:
+                out[out_selection] = chunk_array[chunk_selection]
         else:
             out[out_selection] = self.metadata.fill_value
 
@@ -267,8 +289,9 @@ class ArrayV2:
         if chunk_bytes is None:
             return None
 
-        if self.metadata.compressor is not None:
-            compressor = numcodecs.get_codec(self.metadata.compressor)
+        metadata = self.metadata
+        if metadata.compressor is not None:
+            compressor = numcodecs.get_codec(metadata.compressor)
             chunk_array = ensure_ndarray(
                 await to_thread(compressor.decode, chunk_bytes)
             )
@@ -276,28 +299,48 @@ class ArrayV2:
             chunk_array = ensure_ndarray(chunk_bytes)
 
         # ensure correct dtype
-        if str(chunk_array.dtype) != self.metadata.dtype:
-            chunk_array = chunk_array.view(self.metadata.dtype)
+        if str(chunk_array.dtype) != metadata.dtype:
+            chunk_array = chunk_array.view(metadata.dtype)
 
         # apply filters in reverse order
-        if self.metadata.filters is not None:
-            for filter_metadata in self.metadata.filters[::-1]:
+        if metadata.filters is not None:
+            for filter_metadata in metadata.filters[::-1]:
                 filter = numcodecs.get_codec(filter_metadata)
                 chunk_array = await to_thread(filter.decode, chunk_array)
 
         # ensure correct chunk shape
-        if chunk_array.shape != self.metadata.chunks:
+        if chunk_array.shape != metadata.chunks:
             chunk_array = chunk_array.reshape(
-                self.metadata.chunks,
-                order=self.metadata.order,
+                metadata.chunks,
+                order=metadata.order,
             )
 
         return chunk_array
 
-    def __setitem__(self, selection: Selection, value: np.ndarray) -> None:
+    def _acquire_chunk_buffer(self) -> np.ndarray:
+        # chunk-sized scratch buffers are reused across chunks to avoid
+        # allocator churn; all tasks run on one event loop thread, so
+        # plain list operations are sufficient
+        if self._chunk_buffer_pool:
+            return self._chunk_buffer_pool.pop()
+        return np.empty(
+            self.metadata.chunks,
+            dtype=self.metadata.dtype,
+            order=self.metadata.order,
+        )
+
+    def _release_chunk_buffer(self, chunk_array: np.ndarray) -> None:
+        if len(self._chunk_buffer_pool) < _CHUNK_BUFFER_POOL_SIZE:
+            self._chunk_buffer_pool.append(chunk_array)
+
+    def __setitem__(
+        self, selection: Selection, value: Union[np.ndarray, int, float, bool]
+    ) -> None:
         sync(self.set_async(selection, value), self.runtime_configuration.asyncio_loop)
 
-    async def set_async(self, selection: Selection, value: np.ndarray) -> None:
+    async def set_async(
+        self, selection: Selection, value: Union[np.ndarray, int, float, bool]
+    ) -> None:
         chunk_shape = self.metadata.chunks
         indexer = BasicIndexer(
             selection,
@@ -312,25 +355,65 @@ class ArrayV2:
             # setting a scalar value
             pass
         else:
-            if not hasattr(value, "shape"):
+            if not isinstance(value, np.ndarray):
                 value = np.asarray(value, self.metadata.dtype)
             assert value.shape == sel_shape
             if value.dtype != self.metadata.dtype:
                 value = value.astype(self.metadata.dtype, order="A")
 
+        encode_chunk_key = self._encode_chunk_key
+        chunk_projections = list(indexer)
+
+        if np.isscalar(value):
+            # when broadcasting a scalar, every full chunk holds the same
+            # data: encode it once and reuse the bytes for all of them
+            total_projections = [p for p in chunk_projections if p.is_total]
+            chunk_projections = [p for p in chunk_projections if not p.is_total]
+
+            if total_projections:
+                if (
+                    self.metadata.fill_value is not None
+                    and value == self.metadata.fill_value
+                ):
+                    # chunks that only contain fill_value will be removed
+                    scalar_chunk_bytes = None
+                else:
+                    chunk_array = self._acquire_chunk_buffer()
+                    chunk_array.fill(value)
+                    scalar_chunk_bytes = await self._encode_chunk(chunk_array)
+                    self._release_chunk_buffer(chunk_array)
+
+                async def _write_scalar_chunk(store_path: StorePath) -> None:
+                    if scalar_chunk_bytes is None:
+                        await store_path.delete_async()
+                    else:
+                        await store_path.set_async(scalar_chunk_bytes)
+
+                await concurrent_map(
+                    [
+                        (self.store_path / encode_chunk_key(p.chunk_coords),)
+                        for p in total_projections
+                    ],
+                    _write_scalar_chunk,
+                    self.runtime_configuration.concurrency,
+                )
+
         # merging with existing data and encoding chunks
         await concurrent_map(
             [
                 (
                     value,
                     chunk_shape,
-                    chunk_coords,
-                    chunk_selection,
-                    out_selection,
+                    p.chunk_coords,
+                    p.chunk_selection,
+                    p.out_selection,
+                    p.is_total,
+                    self.store_path / encode_chunk_key(p.chunk_coords),
                 )
-                for chunk_coords, chunk_selection, out_selection in indexer
+                for p in chunk_projections
             ],
             self._write_chunk,
+            self.runtime_configuration.concurrency,
         )
 
     async def _write_chunk(
@@ -340,48 +423,63 @@ class ArrayV2:
         chunk_coords: ChunkCoords,
         chunk_selection: SliceSelection,
         out_selection: SliceSelection,
+        is_total: bool,
+        store_path: StorePath,
     ):
-        store_path = self.store_path / self._encode_chunk_key(chunk_coords)
-
-        if is_total_slice(chunk_selection, chunk_shape):
+        if is_total:
             # write entire chunks
             if np.isscalar(value):
-                chunk_array = np.empty(
-                    chunk_shape,
-                    dtype=self.metadata.dtype,
-                    order=self.metadata.order,
-                )
+                chunk_array = self._acquire_chunk_buffer()
                 chunk_array.fill(value)
+                await self._write_chunk_to_store(store_path, chunk_array)
+                self._release_chunk_buffer(chunk_array)
             else:
                 chunk_array = value[out_selection]
-            await self._write_chunk_to_store(store_path, chunk_array)
+                await self._write_chunk_to_store(store_path, chunk_array)
 
         else:
             # writing partial chunks
-            # read chunk first
-            tmp = await self._decode_chunk(await store_path.get_async())
+            if is_total_slice(
+                chunk_selection,
+                valid_chunk_shape(chunk_coords, chunk_shape, self.metadata.shape),
+            ):
+                # the selection covers the entire valid region of a trailing
+                # chunk; existing data would be overwritten completely, so
+                # there is no need to read the chunk first
+                tmp = None
+            else:
+                # read chunk first
+                tmp = await self._decode_chunk(await store_path.get_async())
 
             # merge new value
+            pooled_buffer = tmp is None
             if tmp is None:
-                chunk_array = np.empty(
-                    chunk_shape,
-                    dtype=self.metadata.dtype,
-                    order=self.metadata.order,
-                )
+                chunk_array = self._acquire_chunk_buffer()
                 chunk_array.fill(self.metadata.fill_value)
             else:
-                chunk_array = tmp.copy(
-                    order=self.metadata.order,
-                )  # make a writable copy
+                if (
+                    tmp.flags.writeable
+                    and tmp.flags[
+                        "C_CONTIGUOUS" if self.metadata.order == "C" else "F_CONTIGUOUS"
+                    ]
+                ):
+                    # already writable and in the right order, no need to copy
+                    chunk_array = tmp
+                else:
+                    chunk_array = tmp.copy(
+                        order=self.metadata.order,
+                    )  # make a writable copy
             chunk_array[chunk_selection] = value[out_selection]
 
             await self._write_chunk_to_store(store_path, chunk_array)
+            if pooled_buffer:
+                self._release_chunk_buffer(chunk_array)
 
     async def _write_chunk_to_store(
         self, store_path: StorePath, chunk_array: np.ndarray
     ):
         chunk_bytes: Optional[BytesLike]
-        if np.all(chunk_array == self.metadata.fill_value):
+        if all_equal(chunk_array, self.metadata.fill_value):
             # chunks that only contain fill_value will be removed
             await store_path.delete_async()
         else:
@@ -392,15 +490,16 @@ class ArrayV2:
                 await store_path.set_async(chunk_bytes)
 
     async def _encode_chunk(self, chunk_array: np.ndarray) -> Optional[BytesLike]:
-        chunk_array = chunk_array.ravel(order=self.metadata.order)
+        metadata = self.metadata
+        chunk_array = chunk_array.ravel(order=metadata.order)
 
-        if self.metadata.filters is not None:
-            for filter_metadata in self.metadata.filters:
+        if metadata.filters is not None:
+            for filter_metadata in metadata.filters:
                 filter = numcodecs.get_codec(filter_metadata)
                 chunk_array = await to_thread(filter.encode, chunk_array)
 
-        if self.metadata.compressor is not None:
-            compressor = numcodecs.get_codec(self.metadata.compressor)
+        if metadata.compressor is not None:
+            compressor = numcodecs.get_codec(metadata.compressor)
             if (
                 not chunk_array.flags.c_contiguous
                 and not chunk_array.flags.f_contiguous
@@ -438,6 +537,7 @@ class ArrayV2:
                 for chunk_coords in old_chunk_coords.difference(new_chunk_coords)
             ],
             _delete_key,
+            self.runtime_configuration.concurrency,
         )
 
         # Write new metadata
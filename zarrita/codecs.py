@@ -100,6 +100,11 @@ class BytesBytesCodec(Codec):
 @frozen
 class CodecPipeline:
     codecs: List[Codec]
+    # partitioned once at construction so that per-chunk decode/encode calls
+    # do not have to re-filter the codec list
+    array_array_codecs: List[ArrayArrayCodec]
+    array_bytes_codec: ArrayBytesCodec
+    bytes_bytes_codecs: List[BytesBytesCodec]
 
     @classmethod
     def from_metadata(
@@ -131,7 +136,18 @@ class CodecPipeline:
             else:
                 raise RuntimeError(f"Unsupported codec: {codec_metadata}")
         CodecPipeline._validate_codecs(out, array_metadata)
-        return cls(out)
+        return cls(
+            codecs=out,
+            array_array_codecs=[
+                codec for codec in out if isinstance(codec, ArrayArrayCodec)
+            ],
+            array_bytes_codec=next(
+                codec for codec in out if isinstance(codec, ArrayBytesCodec)
+            ),
+            bytes_bytes_codecs=[
+                codec for codec in out if isinstance(codec, BytesBytesCodec)
+            ],
+        )
 
     @staticmethod
     def _validate_codecs(
@@ -200,41 +216,30 @@ class CodecPipeline:
                 + "writes, which may lead to inefficient performance."
             )
 
-    def _array_array_codecs(self) -> List[ArrayArrayCodec]:
-        return [codec for codec in self.codecs if isinstance(codec, ArrayArrayCodec)]
-
-    def _array_bytes_codec(self) -> ArrayBytesCodec:
-        return next(
-            codec for codec in self.codecs if isinstance(codec, ArrayBytesCodec)
-        )
-
-    def _bytes_bytes_codecs(self) -> List[BytesBytesCodec]:
-        return [codec for codec in self.codecs if isinstance(codec, BytesBytesCodec)]
-
     async def decode(self, chunk_bytes: BytesLike) -> np.ndarray:
-        for bb_codec in self._bytes_bytes_codecs()[::-1]:
+        for bb_codec in self.bytes_bytes_codecs[::-1]:
             chunk_bytes = await bb_codec.decode(chunk_bytes)
 
-        chunk_array = await self._array_bytes_codec().decode(chunk_bytes)
+        chunk_array = await self.array_bytes_codec.decode(chunk_bytes)
 
-        for aa_codec in self._array_array_codecs()[::-1]:
+        for aa_codec in self.array_array_codecs[::-1]:
             chunk_array = await aa_codec.decode(chunk_array)
 
         return chunk_array
 
     async def encode(self, chunk_array: np.ndarray) -> Optional[BytesLike]:
-        for aa_codec in self._array_array_codecs():
+        for aa_codec in self.array_array_codecs:
             chunk_array_maybe = await aa_codec.encode(chunk_array)
             if chunk_array_maybe is None:
                 return None
             chunk_array = chunk_array_maybe
 
-        chunk_bytes_maybe = await self._array_bytes_codec().encode(chunk_array)
+        chunk_bytes_maybe = await self.array_bytes_codec.encode(chunk_array)
         if chunk_bytes_maybe is None:
             return None
         chunk_bytes = chunk_bytes_maybe
 
-        for bb_codec in self._bytes_bytes_codecs():
+        for bb_codec in self.bytes_bytes_codecs:
             chunk_bytes_maybe = await bb_codec.encode(chunk_bytes)
             if chunk_bytes_maybe is None:
                 return None
@@ -295,6 +300,7 @@ class BloscCodec(BytesBytesCodec):
 class BytesCodec(ArrayBytesCodec):
     array_metadata: CoreArrayMetadata
     configuration: BytesCodecConfigurationMetadata
+    decode_dtype: np.dtype
     is_fixed_size = True
 
     @classmethod
@@ -305,9 +311,19 @@ class BytesCodec(ArrayBytesCodec):
             array_metadata.dtype.itemsize == 1
             or codec_metadata.configuration.endian is not None
         ), "The `endian` configuration needs to be specified for multi-byte data types."
+        # resolve the decoded dtype (including byte order) once, instead of
+        # re-parsing a dtype string for every chunk
+        if array_metadata.dtype.itemsize > 0:
+            prefix = "<" if codec_metadata.configuration.endian == "little" else ">"
+        else:
+            prefix = "|"
+        decode_dtype = np.dtype(
+            f"{prefix}{array_metadata.data_type.to_numpy_shortname()}"
+        )
         return cls(
             array_metadata=array_metadata,
             configuration=codec_metadata.configuration,
+            decode_dtype=decode_dtype,
         )
 
     def _get_byteorder(self, array: np.ndarray) -> Literal["big", "little"]:
@@ -324,19 +340,10 @@ class BytesCodec(ArrayBytesCodec):
         self,
         chunk_bytes: BytesLike,
     ) -> np.ndarray:
-        if self.array_metadata.dtype.itemsize > 0:
-            if self.configuration.endian == "little":
-                prefix = "<"
-            else:
-                prefix = ">"
-            dtype = np.dtype(
-                f"{prefix}{self.array_metadata.data_type.to_numpy_shortname()}"
-            )
-        else:
-            dtype = np.dtype(f"|{self.array_metadata.data_type.to_numpy_shortname()}")
-        chunk_array = np.frombuffer(chunk_bytes, dtype)
+        chunk_array = np.frombuffer(chunk_bytes, self.decode_dtype)
 
-        # ensure correct chunk shape
+        # ensure correct chunk shape; reshaping the 1-d frombuffer result
+        # is a view, not a copy
         if chunk_array.shape != self.array_metadata.chunk_shape:
             chunk_array = chunk_array.reshape(
                 self.array_metadata.chunk_shape,
@@ -362,6 +369,7 @@ class BytesCodec(ArrayBytesCodec):
 class TransposeCodec(ArrayArrayCodec):
     array_metadata: CoreArrayMetadata
     configuration: TransposeCodecConfigurationMetadata
+    decode_dtype: np.dtype
     is_fixed_size = True
 
     @classmethod
@@ -371,6 +379,7 @@ class TransposeCodec(ArrayArrayCodec):
         return cls(
             array_metadata=array_metadata,
             configuration=codec_metadata.configuration,
+            decode_dtype=np.dtype(array_metadata.data_type.value),
         )
 
     async def decode(
@@ -378,7 +387,7 @@ class TransposeCodec(ArrayArrayCodec):
         chunk_array: np.ndarray,
     ) -> np.ndarray:
         new_order = self.configuration.order
-        chunk_array = chunk_array.view(np.dtype(self.array_metadata.data_type.value))
+        chunk_array = chunk_array.view(self.decode_dtype)
         if isinstance(new_order, tuple):
             chunk_array = chunk_array.transpose(new_order)
         elif new_order == "F":
@@ -396,7 +405,9 @@ class TransposeCodec(ArrayArrayCodec):
             chunk_array = chunk_array.transpose(new_order)
         elif new_order == "F":
             chunk_array = chunk_array.T
-        return chunk_array.reshape(-1, order="C")
+        # the transpose is purely a stride permutation; serialization reads
+        # the view in C order anyway, so there is no need to materialize it
+        return chunk_array
 
     def compute_encoded_size(self, input_byte_length: int) -> int:
         return input_byte_length
@@ -508,10 +519,14 @@ class Crc32cCodec(BytesBytesCodec):
 def blosc_codec(
     typesize: int,
     cname: Literal["lz4", "lz4hc", "blosclz", "zstd", "snappy", "zlib"] = "zstd",
-    clevel: int = 5,
-    shuffle: Literal["noshuffle", "shuffle", "bitshuffle"] = "noshuffle",
+    clevel: int = 3,
+    shuffle: Optional[Literal["noshuffle", "shuffle", "bitshuffle"]] = None,
     blocksize: int = 0,
 ) -> BloscCodecMetadata:
+    if shuffle is None:
+        # bit-level shuffling pays off for narrow data types; for wider ones
+        # byte-level shuffling compresses just as well at a fraction of the cost
+        shuffle = "bitshuffle" if 0 < typesize <= 2 else "shuffle"
     return BloscCodecMetadata(
         configuration=BloscCodecConfigurationMetadata(
             cname=cname,
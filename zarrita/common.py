@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import contextvars
 import functools
+import math
 from typing import (
     Any,
     Awaitable,
@@ -30,6 +31,7 @@ SliceSelection = Tuple[slice, ...]
 Selection = Union[slice, SliceSelection]
 
 
+@functools.lru_cache(maxsize=1)
 def make_cattr():
     from zarrita.metadata import (
         BloscCodecMetadata,
@@ -131,7 +133,26 @@ def make_cattr():
 
 
 def product(tup: ChunkCoords) -> int:
-    return functools.reduce(lambda x, y: x * y, tup, 1)
+    return math.prod(tup)
+
+
+def all_equal(array: np.ndarray, value: Any) -> bool:
+    """Checks if all values of `array` equal `value` without materializing a
+    full boolean array, bailing out as early as possible."""
+    if value is None:
+        return False
+    if value == 0:
+        # `any` stops at the first non-zero entry
+        return not array.any()
+    if not array.flags.forc:
+        return bool(np.array_equiv(array, value))
+    # compare in blocks so that chunks with early mismatches return quickly
+    flat = array.reshape(-1)
+    block_size = 16384
+    for offset in range(0, flat.size, block_size):
+        if not np.array_equiv(flat[offset : offset + block_size], value):
+            return False
+    return True
 
 
 T = TypeVar("T", bound=Tuple)
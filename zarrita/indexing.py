@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import itertools
 import math
+from functools import lru_cache
 from typing import Iterator, List, NamedTuple, Optional, Tuple
 
 from zarrita.common import ChunkCoords, Selection, SliceSelection, product
@@ -50,6 +51,7 @@ class _ChunkDimProjection(NamedTuple):
     dim_chunk_ix: int
     dim_chunk_sel: slice
     dim_out_sel: Optional[slice]
+    dim_is_total: bool
 
 
 def _ceildiv(a, b):
@@ -118,13 +120,23 @@ class _SliceDimIndexer:
             )
             dim_out_sel = slice(dim_out_offset, dim_out_offset + dim_chunk_nitems)
 
-            yield _ChunkDimProjection(dim_chunk_ix, dim_chunk_sel, dim_out_sel)
+            # does the selection span the entire (nominal) chunk?
+            dim_is_total = (
+                dim_chunk_sel_start == 0
+                and dim_chunk_sel_stop == self.dim_chunk_len
+                and self.step == 1
+            )
+
+            yield _ChunkDimProjection(
+                dim_chunk_ix, dim_chunk_sel, dim_out_sel, dim_is_total
+            )
 
 
 class _ChunkProjection(NamedTuple):
     chunk_coords: ChunkCoords
     chunk_selection: SliceSelection
     out_selection: SliceSelection
+    is_total: bool
 
 
 class BasicIndexer:
@@ -145,38 +157,54 @@ class BasicIndexer:
             )
         ]
         self.shape = tuple(s.nitems for s in self.dim_indexers)
+        # materialize the per-dimension projections once, so that iterating
+        # the indexer only pays for the cross product
+        self._dim_projections = [list(s) for s in self.dim_indexers]
 
     def __iter__(self) -> Iterator[_ChunkProjection]:
-        for dim_projections in itertools.product(*self.dim_indexers):
-            chunk_coords = tuple(p.dim_chunk_ix for p in dim_projections)
-            chunk_selection = tuple(p.dim_chunk_sel for p in dim_projections)
-            out_selection = tuple(
-                p.dim_out_sel for p in dim_projections if p.dim_out_sel is not None
+        for dim_projections in itertools.product(*self._dim_projections):
+            if not dim_projections:
+                # zero-dimensional array
+                yield _ChunkProjection((), (), (), True)
+                continue
+
+            # transpose the per-dimension projections in one go instead of
+            # one generator expression per field
+            chunk_coords, chunk_selection, dim_out_sels, dim_is_totals = zip(
+                *dim_projections
             )
+            out_selection = tuple(s for s in dim_out_sels if s is not None)
 
-            yield _ChunkProjection(chunk_coords, chunk_selection, out_selection)
+            yield _ChunkProjection(
+                chunk_coords, chunk_selection, out_selection, all(dim_is_totals)
+            )
 
 
-def morton_order_iter(chunk_shape: ChunkCoords) -> Iterator[ChunkCoords]:
-    def decode_morton(z: int, chunk_shape: ChunkCoords) -> ChunkCoords:
-        # Inspired by compressed morton code as implemented in Neuroglancer
-        # https://github.com/google/neuroglancer/blob/master/src/neuroglancer/datasource/precomputed/volume.md#compressed-morton-code
-        bits = tuple(math.ceil(math.log2(c)) for c in chunk_shape)
-        max_coords_bits = max(*bits)
+@lru_cache(maxsize=64)
+def _morton_order(chunk_shape: ChunkCoords) -> Tuple[ChunkCoords, ...]:
+    # Inspired by compressed morton code as implemented in Neuroglancer
+    # https://github.com/google/neuroglancer/blob/master/src/neuroglancer/datasource/precomputed/volume.md#compressed-morton-code
+    bits = tuple(math.ceil(math.log2(c)) for c in chunk_shape)
+    max_coords_bits = max(bits)
+    ndim = len(chunk_shape)
+
+    def decode_morton(z: int) -> ChunkCoords:
         input_bit = 0
-        input_value = z
-        out = [0 for _ in range(len(chunk_shape))]
+        out = [0] * ndim
 
         for coord_bit in range(max_coords_bits):
-            for dim in range(len(chunk_shape)):
+            for dim in range(ndim):
                 if coord_bit < bits[dim]:
-                    bit = (input_value >> input_bit) & 1
+                    bit = (z >> input_bit) & 1
                     out[dim] |= bit << coord_bit
                     input_bit += 1
         return tuple(out)
 
-    for i in range(product(chunk_shape)):
-        yield decode_morton(i, chunk_shape)
+    return tuple(decode_morton(i) for i in range(product(chunk_shape)))
+
+
+def morton_order_iter(chunk_shape: ChunkCoords) -> Iterator[ChunkCoords]:
+    return iter(_morton_order(chunk_shape))
 
 
 def c_order_iter(chunks_per_shard: ChunkCoords) -> Iterator[ChunkCoords]:
@@ -211,6 +239,18 @@ def is_total_slice(item: Selection, shape: ChunkCoords):
         raise TypeError("expected slice or tuple of slices, found %r" % item)
 
 
+def valid_chunk_shape(
+    chunk_coords: ChunkCoords, chunk_shape: ChunkCoords, shape: ChunkCoords
+) -> ChunkCoords:
+    """Shape of the part of a chunk that lies within the array domain.
+    Trailing chunks may be cut off by the array bounds."""
+
+    return tuple(
+        min(chunk_len, dim_len - chunk_ix * chunk_len)
+        for chunk_ix, chunk_len, dim_len in zip(chunk_coords, chunk_shape, shape)
+    )
+
+
 def all_chunk_coords(
     shape: ChunkCoords, chunk_shape: ChunkCoords
 ) -> Iterator[ChunkCoords]:
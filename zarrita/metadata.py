@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from asyncio import AbstractEventLoop
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 import numpy as np
@@ -39,36 +40,44 @@ class DataType(Enum):
 
     @property
     def byte_count(self) -> int:
-        data_type_byte_counts = {
-            DataType.bool: 1,
-            DataType.int8: 1,
-            DataType.int16: 2,
-            DataType.int32: 4,
-            DataType.int64: 8,
-            DataType.uint8: 1,
-            DataType.uint16: 2,
-            DataType.uint32: 4,
-            DataType.uint64: 8,
-            DataType.float32: 4,
-            DataType.float64: 8,
-        }
-        return data_type_byte_counts[self]
+        return _data_type_byte_counts[self]
 
     def to_numpy_shortname(self) -> str:
-        data_type_to_numpy = {
-            DataType.bool: "bool",
-            DataType.int8: "i1",
-            DataType.int16: "i2",
-            DataType.int32: "i4",
-            DataType.int64: "i8",
-            DataType.uint8: "u1",
-            DataType.uint16: "u2",
-            DataType.uint32: "u4",
-            DataType.uint64: "u8",
-            DataType.float32: "f4",
-            DataType.float64: "f8",
-        }
-        return data_type_to_numpy[self]
+        return _data_type_to_numpy[self]
+
+
+_data_type_byte_counts = {
+    DataType.bool: 1,
+    DataType.int8: 1,
+    DataType.int16: 2,
+    DataType.int32: 4,
+    DataType.int64: 8,
+    DataType.uint8: 1,
+    DataType.uint16: 2,
+    DataType.uint32: 4,
+    DataType.uint64: 8,
+    DataType.float32: 4,
+    DataType.float64: 8,
+}
+
+_data_type_to_numpy = {
+    DataType.bool: "bool",
+    DataType.int8: "i1",
+    DataType.int16: "i2",
+    DataType.int32: "i4",
+    DataType.int64: "i8",
+    DataType.uint8: "u1",
+    DataType.uint16: "u2",
+    DataType.uint32: "u4",
+    DataType.uint64: "u8",
+    DataType.float32: "f4",
+    DataType.float64: "f8",
+}
+
+
+@lru_cache(maxsize=len(DataType))
+def _data_type_dtype(data_type: DataType) -> np.dtype:
+    return np.dtype(data_type.value)
 
 
 dtype_to_data_type = {
@@ -109,11 +118,13 @@ class DefaultChunkKeyEncodingMetadata:
     )
     name: Literal["default"] = "default"
 
+    @lru_cache(maxsize=4096)
     def decode_chunk_key(self, chunk_key: str) -> ChunkCoords:
         if chunk_key == "c":
             return ()
         return tuple(map(int, chunk_key[1:].split(self.configuration.separator)))
 
+    @lru_cache(maxsize=4096)
     def encode_chunk_key(self, chunk_coords: ChunkCoords) -> str:
         return self.configuration.separator.join(map(str, ("c",) + chunk_coords))
 
@@ -130,9 +141,11 @@ class V2ChunkKeyEncodingMetadata:
     )
     name: Literal["v2"] = "v2"
 
+    @lru_cache(maxsize=4096)
     def decode_chunk_key(self, chunk_key: str) -> ChunkCoords:
         return tuple(map(int, chunk_key.split(self.configuration.separator)))
 
+    @lru_cache(maxsize=4096)
     def encode_chunk_key(self, chunk_coords: ChunkCoords) -> str:
         chunk_identifier = self.configuration.separator.join(map(str, chunk_coords))
         return "0" if chunk_identifier == "" else chunk_identifier
@@ -252,7 +265,26 @@ class CoreArrayMetadata:
 
     @property
     def dtype(self) -> np.dtype:
-        return np.dtype(self.data_type.value)
+        return _data_type_dtype(self.data_type)
+
+
+def _json_convert_v3(o):
+    if isinstance(o, DataType):
+        return o.name
+    raise TypeError
+
+
+def _json_convert_v2(o):
+    if isinstance(o, np.dtype):
+        if o.fields is None:
+            return o.str
+        else:
+            return o.descr
+    raise TypeError
+
+
+def _filter_dimension_names(attr, value):
+    return attr.name != "dimension_names" or value is not None
 
 
 @frozen
@@ -270,7 +302,7 @@ class ArrayMetadata:
 
     @property
     def dtype(self) -> np.dtype:
-        return np.dtype(self.data_type.value)
+        return _data_type_dtype(self.data_type)
 
     def get_core_metadata(
         self, runtime_configuration: RuntimeConfiguration
@@ -284,18 +316,9 @@ class ArrayMetadata:
         )
 
     def to_bytes(self) -> bytes:
-        def _json_convert(o):
-            if isinstance(o, DataType):
-                return o.name
-            raise TypeError
-
         return json.dumps(
-            asdict(
-                self,
-                filter=lambda attr, value: attr.name != "dimension_names"
-                or value is not None,
-            ),
-            default=_json_convert,
+            asdict(self, filter=_filter_dimension_names),
+            default=_json_convert_v3,
         ).encode()
 
     @classmethod
@@ -316,15 +339,7 @@ class ArrayV2Metadata:
     zarr_format: Literal[2] = 2
 
     def to_bytes(self) -> bytes:
-        def _json_convert(o):
-            if isinstance(o, np.dtype):
-                if o.fields is None:
-                    return o.str
-                else:
-                    return o.descr
-            raise TypeError
-
-        return json.dumps(asdict(self), default=_json_convert).encode()
+        return json.dumps(asdict(self), default=_json_convert_v2).encode()
 
     @classmethod
     def from_json(cls, zarr_json: Any) -> ArrayV2Metadata:
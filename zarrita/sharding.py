@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple
 
 import numpy as np
 from attrs import frozen
@@ -10,15 +10,11 @@ from zarrita.common import (
     BytesLike,
     ChunkCoords,
     SliceSelection,
+    all_equal,
     concurrent_map,
     product,
 )
-from zarrita.indexing import (
-    BasicIndexer,
-    c_order_iter,
-    is_total_slice,
-    morton_order_iter,
-)
+from zarrita.indexing import BasicIndexer, c_order_iter, morton_order_iter
 from zarrita.metadata import (
     CoreArrayMetadata,
     DataType,
@@ -255,9 +251,10 @@ class ShardingCodec(ArrayBytesCodec):
                     chunk_coords,
                     chunk_selection,
                     out_selection,
+                    is_total,
                     out,
                 )
-                for chunk_coords, chunk_selection, out_selection in indexer
+                for chunk_coords, chunk_selection, out_selection, is_total in indexer
             ],
             self._read_chunk,
             self.array_metadata.runtime_configuration.concurrency,
@@ -288,7 +285,7 @@ class ShardingCodec(ArrayBytesCodec):
         )
 
         indexed_chunks = list(indexer)
-        all_chunk_coords = set(chunk_coords for chunk_coords, _, _ in indexed_chunks)
+        all_chunk_coords = set(chunk_coords for chunk_coords, _, _, _ in indexed_chunks)
 
         # reading bytes of all requested chunks
         shard_dict: Mapping[ChunkCoords, BytesLike] = {}
@@ -303,13 +300,9 @@ class ShardingCodec(ArrayBytesCodec):
             shard_index = await self._load_shard_index_maybe(store_path)
             if shard_index is None:
                 return None
-            shard_dict = {}
-            for chunk_coords in all_chunk_coords:
-                chunk_byte_slice = shard_index.get_chunk_slice(chunk_coords)
-                if chunk_byte_slice:
-                    chunk_bytes = await store_path.get_async(chunk_byte_slice)
-                    if chunk_bytes:
-                        shard_dict[chunk_coords] = chunk_bytes
+            shard_dict = await self._load_partial_shard(
+                store_path, shard_index, all_chunk_coords
+            )
 
         # decoding chunks and writing them into the output buffer
         await concurrent_map(
@@ -319,9 +312,15 @@ class ShardingCodec(ArrayBytesCodec):
                     chunk_coords,
                     chunk_selection,
                     out_selection,
+                    is_total,
                     out,
                 )
-                for chunk_coords, chunk_selection, out_selection in indexed_chunks
+                for (
+                    chunk_coords,
+                    chunk_selection,
+                    out_selection,
+                    is_total,
+                ) in indexed_chunks
             ],
             self._read_chunk,
             self.array_metadata.runtime_configuration.concurrency,
@@ -335,13 +334,17 @@ class ShardingCodec(ArrayBytesCodec):
         chunk_coords: ChunkCoords,
         chunk_selection: SliceSelection,
         out_selection: SliceSelection,
+        is_total: bool,
         out: np.ndarray,
     ):
         chunk_bytes = shard_dict.get(chunk_coords, None)
         if chunk_bytes is not None:
             chunk_array = await self.codec_pipeline.decode(chunk_bytes)
-            tmp = chunk_array[chunk_selection]
-            out[out_selection] = tmp
+            if is_total:
+                # the selection spans the whole chunk, no need to slice
+                out[out_selection] = chunk_array
+            else:
+                out[out_selection] = chunk_array[chunk_selection]
         else:
             out[out_selection] = self.array_metadata.fill_value
 
@@ -360,26 +363,31 @@ class ShardingCodec(ArrayBytesCodec):
             )
         )
 
+        dtype = self.array_metadata.dtype
+        fill_value = self.array_metadata.fill_value
+        codec_pipeline = self.codec_pipeline
+
         async def _write_chunk(
             shard_array: np.ndarray,
             chunk_coords: ChunkCoords,
             chunk_selection: SliceSelection,
             out_selection: SliceSelection,
+            is_total: bool,
         ) -> Tuple[ChunkCoords, Optional[BytesLike]]:
-            if is_total_slice(chunk_selection, chunk_shape):
+            if is_total:
                 chunk_array = shard_array[out_selection]
             else:
                 # handling writing partial chunks
                 chunk_array = np.empty(
                     chunk_shape,
-                    dtype=self.array_metadata.dtype,
+                    dtype=dtype,
                 )
-                chunk_array.fill(self.array_metadata.fill_value)
+                chunk_array.fill(fill_value)
                 chunk_array[chunk_selection] = shard_array[out_selection]
-            if not np.array_equiv(chunk_array, self.array_metadata.fill_value):
+            if not all_equal(chunk_array, fill_value):
                 return (
                     chunk_coords,
-                    await self.codec_pipeline.encode(chunk_array),
+                    await codec_pipeline.encode(chunk_array),
                 )
             return (chunk_coords, None)
 
@@ -388,8 +396,8 @@ class ShardingCodec(ArrayBytesCodec):
             Tuple[ChunkCoords, Optional[BytesLike]]
         ] = await concurrent_map(
             [
-                (shard_array, chunk_coords, chunk_selection, out_selection)
-                for chunk_coords, chunk_selection, out_selection in indexer
+                (shard_array, chunk_coords, chunk_selection, out_selection, is_total)
+                for chunk_coords, chunk_selection, out_selection, is_total in indexer
             ],
             _write_chunk,
             self.array_metadata.runtime_configuration.concurrency,
@@ -430,13 +438,18 @@ class ShardingCodec(ArrayBytesCodec):
             )
         )
 
+        dtype = self.array_metadata.dtype
+        fill_value = self.array_metadata.fill_value
+        codec_pipeline = self.codec_pipeline
+
         async def _write_chunk(
             chunk_coords: ChunkCoords,
             chunk_selection: SliceSelection,
             out_selection: SliceSelection,
+            is_total: bool,
         ) -> Tuple[ChunkCoords, Optional[BytesLike]]:
             chunk_array = None
-            if is_total_slice(chunk_selection, self.configuration.chunk_shape):
+            if is_total:
                 chunk_array = shard_array[out_selection]
             else:
                 # handling writing partial chunks
@@ -446,20 +459,22 @@ class ShardingCodec(ArrayBytesCodec):
                 # merge new value
                 if chunk_bytes is None:
                     chunk_array = np.empty(
-                        self.configuration.chunk_shape,
-                        dtype=self.array_metadata.dtype,
+                        chunk_shape,
+                        dtype=dtype,
                     )
-                    chunk_array.fill(self.array_metadata.fill_value)
+                    chunk_array.fill(fill_value)
                 else:
-                    chunk_array = (
-                        await self.codec_pipeline.decode(chunk_bytes)
-                    ).copy()  # make a writable copy
+                    chunk_array = await codec_pipeline.decode(chunk_bytes)
+                    if not chunk_array.flags.writeable:
+                        # decoding may return a read-only view over the
+                        # shard buffer
+                        chunk_array = chunk_array.copy()
                 chunk_array[chunk_selection] = shard_array[out_selection]
 
-            if not np.array_equiv(chunk_array, self.array_metadata.fill_value):
+            if not all_equal(chunk_array, fill_value):
                 return (
                     chunk_coords,
-                    await self.codec_pipeline.encode(chunk_array),
+                    await codec_pipeline.encode(chunk_array),
                 )
             else:
                 return (chunk_coords, None)
@@ -472,8 +487,9 @@ class ShardingCodec(ArrayBytesCodec):
                     chunk_coords,
                     chunk_selection,
                     out_selection,
+                    is_total,
                 )
-                for chunk_coords, chunk_selection, out_selection in indexer
+                for chunk_coords, chunk_selection, out_selection, is_total in indexer
             ],
             _write_chunk,
             self.array_metadata.runtime_configuration.concurrency,
@@ -498,6 +514,50 @@ class ShardingCodec(ArrayBytesCodec):
                 )
             )
 
+    async def _load_partial_shard(
+        self,
+        store_path: StorePath,
+        shard_index: _ShardIndex,
+        all_chunk_coords: Set[ChunkCoords],
+    ) -> Mapping[ChunkCoords, BytesLike]:
+        chunk_byte_slices: List[Tuple[Tuple[int, int], ChunkCoords]] = []
+        for chunk_coords in all_chunk_coords:
+            chunk_byte_slice = shard_index.get_chunk_slice(chunk_coords)
+            if chunk_byte_slice:
+                chunk_byte_slices.append((chunk_byte_slice, chunk_coords))
+        chunk_byte_slices.sort()
+
+        # chunks are laid out back-to-back within the shard, so requested
+        # chunks that are adjacent in the shard can share one range read
+        range_groups: List[List[Tuple[Tuple[int, int], ChunkCoords]]] = []
+        for entry in chunk_byte_slices:
+            if range_groups and range_groups[-1][-1][0][1] == entry[0][0]:
+                range_groups[-1].append(entry)
+            else:
+                range_groups.append([entry])
+
+        shard_dict: Dict[ChunkCoords, BytesLike] = {}
+
+        async def _load_range(
+            range_group: List[Tuple[Tuple[int, int], ChunkCoords]]
+        ) -> None:
+            range_start = range_group[0][0][0]
+            range_bytes = await store_path.get_async(
+                (range_start, range_group[-1][0][1])
+            )
+            if range_bytes:
+                for (chunk_start, chunk_stop), chunk_coords in range_group:
+                    shard_dict[chunk_coords] = range_bytes[
+                        chunk_start - range_start : chunk_stop - range_start
+                    ]
+
+        await concurrent_map(
+            [(range_group,) for range_group in range_groups],
+            _load_range,
+            self.array_metadata.runtime_configuration.concurrency,
+        )
+        return shard_dict
+
     def _is_total_shard(self, all_chunk_coords: Set[ChunkCoords]) -> bool:
         return len(all_chunk_coords) == product(self.chunks_per_shard) and all(
             chunk_coords in all_chunk_coords
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import threading
-from typing import Any, Coroutine, List, Optional
+from concurrent.futures import TimeoutError
+from typing import Coroutine, List, Optional
 
 # From https://github.com/fsspec/filesystem_spec/blob/master/fsspec/asyn.py
 
@@ -25,17 +26,6 @@ def _get_lock() -> threading.Lock:
     return _lock
 
 
-async def _runner(
-    event: threading.Event, coro: Coroutine, result_box: List[Optional[Any]]
-):
-    try:
-        result_box[0] = await coro
-    except Exception as ex:
-        result_box[0] = ex
-    finally:
-        event.set()
-
-
 def sync(coro: Coroutine, loop: Optional[asyncio.AbstractEventLoop] = None):
     """
     Make loop run coroutine until it returns. Runs in other thread
@@ -56,19 +46,17 @@ def sync(coro: Coroutine, loop: Optional[asyncio.AbstractEventLoop] = None):
             raise NotImplementedError("Calling sync() from within a running loop")
     except RuntimeError:
         pass
-    result_box: List[Optional[Any]] = [None]
-    event = threading.Event()
-    asyncio.run_coroutine_threadsafe(_runner(event, coro, result_box), loop)
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
     while True:
-        # this loops allows thread to get interrupted
-        if event.wait(1):
-            break
-
-    return_result = result_box[0]
-    if isinstance(return_result, BaseException):
-        raise return_result
-    else:
-        return return_result
+        # the timeout allows the thread to get interrupted
+        try:
+            return future.result(timeout=1)
+        except TimeoutError:
+            # on Python 3.11+ concurrent.futures.TimeoutError is the builtin
+            # TimeoutError, so this is also raised when the coroutine itself
+            # timed out; only keep waiting if the future is still pending
+            if future.done():
+                raise
 
 
 def _get_loop():